@@ -5,21 +5,49 @@
         async with ComarchSOAPAsyncClient(username="", password="", uri="") as client:
             response = await client.get_balance("000000000")
 """
+import asyncio
 import logging
+import re
 import time
 import uuid
-import xml.dom.minidom
+from copy import deepcopy
 from datetime import datetime
-from typing import List, Optional, Union
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 
-import xmltodict
-from aiohttp import ClientSession, ClientError
+from aiohttp import ClientSession, ClientError, TCPConnector
+from lxml import etree
 
 from . import exceptions
 from .models.customer import Customer
 
 logger = logging.getLogger(__name__)
 
+SOAP_ENV_NS = "http://schemas.xmlsoap.org/soap/envelope/"
+COMARCH_NS = "http://interfaces.esb.clm.comarch.com/"
+NSMAP = {"soapenv": SOAP_ENV_NS, "int": COMARCH_NS}
+
+# soap methods supported by the client
+METHODS = (
+    "getBalance",
+    "getCustomer",
+    "getTransactions",
+    "getAccountSummary",
+    "mergeAccount",
+    "reverseNonAirlineAccrual",
+    "nonAirlineAccrual",
+    "enroll",
+)
+
+# max number of bytes of non 200 or malformed response included in error
+ERROR_BODY_LIMIT = 4096
+
+# escaping of xml text nodes for hand-rendered payloads
+_XML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", "\r": "&#13;"})
+# characters not allowed in xml 1.0 documents, rejected by lxml as well
+_XML_ILLEGAL = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+
+_PARSER = etree.XMLParser(remove_blank_text=True, resolve_entities=False, huge_tree=False)
+
 
 class ComarchSOAPAsyncClient:
 
@@ -27,6 +55,7 @@ class ComarchSOAPAsyncClient:
     password = None
     timeout = None
     uri = None
+    session = None
 
     headers = {
         "content-type": 'text/xml; charset="utf-8"',
@@ -35,7 +64,35 @@ class ComarchSOAPAsyncClient:
         "pragma": "no-cache",
     }
 
-    def __init__(self, username: str, password: str, uri: str, timeout: int = None):
+    # some methods expect request class name that differs from the method name
+    _class_replace_map = {
+        "nonAirlineAccrual": "nonAirAccrual",
+    }
+
+    # max number of cached reads, the oldest ones are evicted first
+    _read_cache_size = 1024
+
+    # card lookups that may be served from the read cache
+    _cached_reads = ("getBalance", "getCustomer", "getAccountSummary")
+
+    # compiled lookups of the <{method}Response> element in soap response
+    _response_xpath = {
+        method: etree.XPath(
+            f"/s:Envelope/s:Body/n:{method}Response", namespaces={"s": SOAP_ENV_NS, "n": COMARCH_NS}
+        )
+        for method in METHODS
+    }
+
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        uri: str,
+        timeout: int = None,
+        pool_size: int = 100,
+        connector: Optional[TCPConnector] = None,
+        read_ttl: Optional[float] = None,
+    ):
         """
         Comarch SOAP api client
 
@@ -43,12 +100,31 @@ class ComarchSOAPAsyncClient:
         :param password:
         :param uri:
         :param timeout: request timeout
+        :param pool_size: max number of simultaneous connections
+        :param connector: custom connector, pool_size is ignored if passed
+        :param read_ttl: seconds to cache get_balance, get_customer and get_account_summary responses,
+                         caching is disabled by default
         """
         self.username = username
         self.password = password
         self.uri = uri
         if timeout is not None:
             self.timeout = timeout
+        self.pool_size = pool_size
+        self.connector = connector
+        self.read_ttl = read_ttl
+
+        # (method, card number) -> (monotonic time, response)
+        self._read_cache: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+        self._read_locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        # bumped on every invalidation, reads started before it are not cached
+        self._read_cache_epoch = 0
+
+        # everything around the <data> block depends only on method and credentials
+        self._envelopes: Dict[str, Tuple[bytes, bytes]] = {}
+
+        # rendered envelopes and cached reads are dropped whenever username or password change
+        self._credentials: Optional[Tuple[str, str]] = None
 
     async def _make_request(self, method: str, query_params: dict, **kwargs) -> dict:
         """
@@ -59,66 +135,125 @@ class ComarchSOAPAsyncClient:
         :param kwargs:
         :return:
         """
-        start_ts = time.time()
-        request_id = str(uuid.uuid4())
+        start_ns = time.monotonic_ns()
 
-        _class_replace_map = {
-            'nonAirlineAccrual': 'nonAirAccrual',
-        }
-        query = {
-            _class_replace_map.get(method, method): {
-                "context": {"langCode": "en-us", "clientLogin": self.username, "clientPass": self.password},
-                "data": query_params,
-            }
-        }
-        template = {
-            "soapenv:Envelope": {
-                "@xmlns:soapenv": "http://schemas.xmlsoap.org/soap/envelope/",
-                "@xmlns:int": "http://interfaces.esb.clm.comarch.com/",
-                "soapenv:Header": {},
-                "soapenv:Body": {f"int:{method}": query},
-            }
-        }
-        request_data = xmltodict.unparse(template, short_empty_elements=True)
+        self._sync_credentials()
+        prefix, suffix = self._get_envelope(method)
+        request_data = prefix + self._serialize_data(query_params) + suffix
 
         try:
-            res = await self.session.post(
-                self.uri, data=request_data.encode("utf-8"), headers=self.headers, timeout=self.timeout,
-            )
+            res = await self._get_session().post(self.uri, data=request_data, timeout=self.timeout)
         except ClientError as e:
-            self._log("warning", request_id, method, start_ts, time.time(), request_data, error=e)
+            self._log("warning", method, (time.monotonic_ns() - start_ns) / 1e9, request_data, error=e)
             raise exceptions.ComarchConnectionError(internal_message=e)
 
-        response_data = await res.text()
-
-        # check answer
+        # check answer, error body is only needed for the message so it is not read in full
         if res.status != 200:
+            error_data = b""
+            while len(error_data) < ERROR_BODY_LIMIT:
+                chunk = await res.content.read(ERROR_BODY_LIMIT - len(error_data))
+                if not chunk:
+                    break
+                error_data += chunk
+            res.release()
             raise exceptions.ComarchConnectionError(
-                internal_message=f"Response status code: {res.status}; response: {response_data}"
+                internal_message=f"Response status code: {res.status}; "
+                f"response: {error_data.decode('utf-8', errors='replace')}"
             )
 
-        data = ((xmltodict.parse(response_data).get("soap:Envelope") or {}).get("soap:Body") or {}).get(
-            f"ns2:{method}Response"
-        )
+        response_data = await res.read()
 
-        if data is None:
+        try:
+            root = etree.fromstring(response_data, _PARSER)
+        except etree.XMLSyntaxError:
+            raise exceptions.ComarchConnectionError(
+                internal_message="Comarch invalid response: "
+                f"{response_data[:ERROR_BODY_LIMIT].decode('utf-8', errors='replace')}"
+            )
+
+        data = self._response_xpath[method](root)
+        result = data[0].find("return") if data else None
+
+        if result is None:
             raise exceptions.ComarchConnectionError(
                 internal_message=f"Comarch soap error response:\n\n{self._prettify_xml(response_data)}\n"
             )
 
-        self._log("debug", request_id, method, start_ts, time.time(), request_data, response_data, res.status)
+        self._log("debug", method, (time.monotonic_ns() - start_ns) / 1e9, request_data, response_data, res.status)
 
-        return data["return"]
+        return self._xml_to_dict(result)
+
+    @classmethod
+    def _serialize_data(cls, query_params: dict) -> bytes:
+        """
+        Render <data> block of the request
+
+        Flat string params (card lookups, merge) are rendered directly, anything else goes through lxml.
+        """
+        if all(type(value) is str for value in query_params.values()):
+            fields = "".join(f"<{key}>{value.translate(_XML_ESCAPE)}</{key}>" for key, value in query_params.items())
+            if _XML_ILLEGAL.search(fields):
+                raise ValueError(
+                    "All strings must be XML compatible: Unicode or ASCII, no NULL bytes or control characters"
+                )
+            return f"<data>{fields}</data>".encode("utf-8")
+
+        data = etree.Element("data")
+        cls._dict_to_xml(data, query_params)
+        return etree.tostring(data, encoding="utf-8", xml_declaration=False)
+
+    def _sync_credentials(self):
+        """Drop everything rendered or fetched with previous username and password"""
+        credentials = (self.username, self.password)
+        if credentials != self._credentials:
+            self._envelopes = {}
+            self._read_cache.clear()
+            self._read_locks.clear()
+            self._read_cache_epoch += 1
+            self._credentials = credentials
+
+    def _get_envelope(self, method: str) -> Tuple[bytes, bytes]:
+        """
+        Serialized soap envelope for method, rendered on first use for current credentials
+
+        :param method: soap method
+        :return: (prefix, suffix)
+        """
+        envelope = self._envelopes.get(method)
+        if envelope is None:
+            envelope = self._envelopes[method] = self._build_envelope(method)
+        return envelope
+
+    def _build_envelope(self, method: str) -> Tuple[bytes, bytes]:
+        """
+        Serialized soap envelope for method, split at the place where <data> block goes
+
+        :param method: soap method
+        :return: (prefix, suffix)
+        """
+        envelope = etree.Element(f"{{{SOAP_ENV_NS}}}Envelope", nsmap=NSMAP)
+        etree.SubElement(envelope, f"{{{SOAP_ENV_NS}}}Header")
+        body = etree.SubElement(etree.SubElement(envelope, f"{{{SOAP_ENV_NS}}}Body"), f"{{{COMARCH_NS}}}{method}")
+        query_class = self._class_replace_map.get(method, method)
+        self._dict_to_xml(
+            body,
+            {
+                query_class: {
+                    "context": {"langCode": "en-us", "clientLogin": self.username, "clientPass": self.password},
+                }
+            },
+        )
+        envelope_data = etree.tostring(envelope, xml_declaration=True, encoding="utf-8")
+        split_at = envelope_data.rindex(f"</{query_class}>".encode("utf-8"))
+        return envelope_data[:split_at], envelope_data[split_at:]
 
     def _log(
         self,
         level: str,
-        request_id: str,
         method: str,
-        start_time: float,
-        end_time: float,
-        request: str = None,
-        response: str = None,
+        duration: float,
+        request: bytes = None,
+        response: bytes = None,
         response_code: int = None,
         error: Exception = None,
     ):
@@ -126,17 +261,19 @@ class ComarchSOAPAsyncClient:
         Logging request and response
 
         :param level: logging level
-        :param request_id: request uuid
         :param method: soap method name
         :param response_code: response code
         :param request: request body
         :param response: response body
-        :param start_time: request started
-        :param end_time: completed
+        :param duration: request duration in seconds
         :param error: error
         """
+        # prettifying xml is expensive, so skip everything if the record would be dropped anyway
+        if not logger.isEnabledFor(logging.getLevelName(level.upper())):
+            return
 
-        message = f"Request {request_id} method {method}"
+        # request id only tags the log record, so it is generated once we know the record is emitted
+        message = f"Request {uuid.uuid4().hex} method {method}"
         if request:
             request = f"Comarch soap request:\n\n{self._prettify_xml(request)}\n"
         if response:
@@ -147,7 +284,7 @@ class ComarchSOAPAsyncClient:
             response_code=response_code,
             request=request,
             response=response,
-            duration=round(end_time - start_time, 3),
+            duration=round(duration, 3),
         )
 
         if error and isinstance(error, Exception):
@@ -164,20 +301,175 @@ class ComarchSOAPAsyncClient:
         except AttributeError:
             self._cm_depth = 0
 
-        if self._cm_depth == 0:
-            self.session = ClientSession()
+        self._get_session()
         self._cm_depth += 1
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         self._cm_depth -= 1
         if self._cm_depth <= 0:
+            await self.aclose()
+
+    def _get_session(self) -> ClientSession:
+        """
+        Current http session, opened on first use
+
+        Long-running services may use the client without a context manager
+        to keep connections alive for the process lifetime, calling aclose() on shutdown.
+        """
+        if self.session is None or self.session.closed:
+            if self.connector is not None:
+                connector, connector_owner = self.connector, False
+            else:
+                connector = TCPConnector(
+                    limit=self.pool_size, limit_per_host=self.pool_size, keepalive_timeout=75, ttl_dns_cache=300,
+                )
+                connector_owner = True
+            self.session = ClientSession(connector=connector, connector_owner=connector_owner, headers=self.headers)
+        return self.session
+
+    async def aclose(self) -> None:
+        """Close http session"""
+        if self.session is not None:
             await self.session.close()
+            self.session = None
 
     @staticmethod
-    def _prettify_xml(xml_text):
+    def _prettify_xml(xml_text: Union[str, bytes]) -> str:
         """Prettify XML"""
-        return xml.dom.minidom.parseString(xml_text).toprettyxml()
+        if isinstance(xml_text, str):
+            xml_text = xml_text.encode("utf-8")
+        return etree.tostring(etree.fromstring(xml_text, _PARSER), pretty_print=True, encoding="unicode")
+
+    @classmethod
+    def _dict_to_xml(cls, parent: etree._Element, data: dict):
+        """
+        Append data as child elements of parent
+
+        Lists are rendered as repeated elements, booleans as true/false and None as an empty element.
+        """
+        for tag, value in data.items():
+            for item in value if isinstance(value, list) else (value,):
+                element = etree.SubElement(parent, tag)
+                if isinstance(item, dict):
+                    cls._dict_to_xml(element, item)
+                elif isinstance(item, bool):
+                    element.text = "true" if item else "false"
+                elif item is not None:
+                    element.text = str(item)
+
+    @staticmethod
+    def _qualified_name(name: str, nsmap: dict) -> str:
+        """Element or attribute name in prefix:localname form"""
+        qname = etree.QName(name)
+        for prefix, uri in nsmap.items():
+            if prefix and uri == qname.namespace:
+                return f"{prefix}:{qname.localname}"
+        return qname.localname
+
+    @classmethod
+    def _xml_to_dict(cls, element: etree._Element) -> Any:
+        """
+        Convert response element to python structures
+
+        Mirrors xmltodict: repeated children become lists, attributes are prefixed with "@",
+        leaf elements become their text (None if empty).
+        """
+        # namespace declarations made on this element are reported as attributes, like xmltodict does
+        parent = element.getparent()
+        parent_nsmap = parent.nsmap if parent is not None else {}
+        result = {
+            f"@xmlns:{prefix}" if prefix else "@xmlns": uri
+            for prefix, uri in element.nsmap.items()
+            if parent_nsmap.get(prefix) != uri
+        }
+        result.update({f"@{cls._qualified_name(k, element.nsmap)}": v for k, v in element.attrib.items()})
+
+        texts = [element.text] if element.text else []
+        for child in element:
+            if child.tail:
+                texts.append(child.tail)
+            if not isinstance(child.tag, str):
+                # comments and processing instructions
+                continue
+            key = cls._qualified_name(child.tag, child.nsmap)
+            value = cls._xml_to_dict(child)
+            if key not in result:
+                result[key] = value
+            elif isinstance(result[key], list):
+                result[key].append(value)
+            else:
+                result[key] = [result[key], value]
+
+        text = "".join(texts).strip()
+        if not result:
+            return text or None
+        if text:
+            result["#text"] = text
+        return result
+
+    async def _cached_read(self, method: str, card_number: str) -> dict:
+        """
+        Idempotent card lookup, cached for read_ttl seconds
+
+        Concurrent calls for the same card wait for a single request.
+        Every caller gets its own copy of the response.
+
+        :param method: soap method
+        :param card_number: customer's loyalty card number
+        :return:
+        """
+        if not self.read_ttl:
+            return await self._make_request(method, dict(cardNo=card_number))
+
+        self._sync_credentials()
+        key = (method, card_number)
+        lock = self._read_locks.get(key)
+        if lock is None:
+            lock = self._read_locks[key] = asyncio.Lock()
+        try:
+            async with lock:
+                cached = self._read_cache.get(key)
+                if cached is not None and time.monotonic() - cached[0] < self.read_ttl:
+                    return deepcopy(cached[1])
+                epoch = self._read_cache_epoch
+                data = await self._make_request(method, dict(cardNo=card_number))
+                if epoch != self._read_cache_epoch:
+                    # a write or credentials change happened meanwhile, response may be outdated
+                    return data
+                # re-insert to keep dict order from the oldest entry to the newest one
+                self._read_cache.pop(key, None)
+                self._read_cache[key] = (time.monotonic(), data)
+                self._evict_oldest()
+        finally:
+            # failed requests leave nothing cached, so their lock must not outlive them
+            if key not in self._read_cache and self._read_locks.get(key) is lock:
+                del self._read_locks[key]
+        return deepcopy(data)
+
+    def _invalidate_reads(self, *card_numbers: str):
+        """
+        Drop cached reads of cards changed by a write request
+
+        :param card_numbers: affected loyalty card numbers
+        """
+        self._read_cache_epoch += 1
+        for card_number in card_numbers:
+            for method in self._cached_reads:
+                key = (method, card_number)
+                self._read_cache.pop(key, None)
+                lock = self._read_locks.get(key)
+                if lock is not None and not lock.locked():
+                    del self._read_locks[key]
+
+    def _evict_oldest(self):
+        """Drop the oldest cache entries (and their idle locks) above _read_cache_size"""
+        while len(self._read_cache) > self._read_cache_size:
+            key = next(iter(self._read_cache))
+            del self._read_cache[key]
+            lock = self._read_locks.get(key)
+            if lock is not None and not lock.locked():
+                del self._read_locks[key]
 
     async def get_balance(self, card_number: str) -> dict:
         """
@@ -185,7 +477,7 @@ class ComarchSOAPAsyncClient:
         :param card_number: customer's loyalty card number
         :return:
         """
-        return await self._make_request("getBalance", dict(cardNo=card_number))
+        return await self._cached_read("getBalance", card_number)
 
     async def get_customer(self, card_number: str) -> dict:
         """
@@ -193,7 +485,7 @@ class ComarchSOAPAsyncClient:
         :param card_number: customer's loyalty card number
         :return:
         """
-        return await self._make_request("getCustomer", dict(cardNo=card_number))
+        return await self._cached_read("getCustomer", card_number)
 
     async def get_transactions(self, card_number: str) -> dict:
         """
@@ -209,7 +501,68 @@ class ComarchSOAPAsyncClient:
         :param card_number: customer's loyalty card number
         :return:
         """
-        return await self._make_request("getAccountSummary", dict(cardNo=card_number))
+        return await self._cached_read("getAccountSummary", card_number)
+
+    @staticmethod
+    async def _gather(
+        method: Callable[[str], Awaitable[dict]], card_numbers: List[str], concurrency: int
+    ) -> List[dict]:
+        """
+        Call method for each card number, running at most `concurrency` requests at once
+
+        :param method: single card client method
+        :param card_numbers: customers' loyalty card numbers
+        :param concurrency: max number of simultaneous requests
+        :return: results in the order of card_numbers
+        """
+        if concurrency < 1:
+            raise ValueError("Expected positive concurrency")
+        if not card_numbers:
+            return []
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one(card_number: str) -> dict:
+            async with semaphore:
+                return await method(card_number)
+
+        return await asyncio.gather(*(one(card_number) for card_number in card_numbers))
+
+    async def get_balances(self, card_numbers: List[str], concurrency: int = 16) -> List[dict]:
+        """
+        retrieving points balance for several cards
+        :param card_numbers: customers' loyalty card numbers
+        :param concurrency: max number of simultaneous requests
+        :return:
+        """
+        return await self._gather(self.get_balance, card_numbers, concurrency)
+
+    async def get_customers(self, card_numbers: List[str], concurrency: int = 16) -> List[dict]:
+        """
+        retrieving customer data for several cards
+        :param card_numbers: customers' loyalty card numbers
+        :param concurrency: max number of simultaneous requests
+        :return:
+        """
+        return await self._gather(self.get_customer, card_numbers, concurrency)
+
+    async def get_transactions_many(self, card_numbers: List[str], concurrency: int = 16) -> List[dict]:
+        """
+        finding transactions for several cards
+        :param card_numbers: customers' loyalty card numbers
+        :param concurrency: max number of simultaneous requests
+        :return:
+        """
+        return await self._gather(self.get_transactions, card_numbers, concurrency)
+
+    async def get_account_summaries(self, card_numbers: List[str], concurrency: int = 16) -> List[dict]:
+        """
+        retrieving account summary for several cards
+        :param card_numbers: customers' loyalty card numbers
+        :param concurrency: max number of simultaneous requests
+        :return:
+        """
+        return await self._gather(self.get_account_summary, card_numbers, concurrency)
 
     async def merge_account(self, source_card_number: str, destination_card_number: str) -> dict:
         """
@@ -219,9 +572,12 @@ class ComarchSOAPAsyncClient:
         :param destination_card_number: recipient loyalty card number
         :return:
         """
-        return await self._make_request(
-            "mergeAccount", dict(sourceCardNo=source_card_number, destinationCardNo=destination_card_number)
-        )
+        try:
+            return await self._make_request(
+                "mergeAccount", dict(sourceCardNo=source_card_number, destinationCardNo=destination_card_number)
+            )
+        finally:
+            self._invalidate_reads(source_card_number, destination_card_number)
 
     async def reverse_non_airline_accrual(
             self,
@@ -262,16 +618,20 @@ class ComarchSOAPAsyncClient:
             "partnerCode": partner_code,
             "trnType": transaction_type,
         }
-        optionals = {
-            "trnId": transaction_id,
-            "prtTrnId": partner_transaction_id,
-            "value": value,
-            "desc": description,
-        }
-        args.update((k, v) for k, v in optionals.items() if v is not None)
+        if transaction_id is not None:
+            args["trnId"] = transaction_id
+        if partner_transaction_id is not None:
+            args["prtTrnId"] = partner_transaction_id
+        if value is not None:
+            args["value"] = value
+        if description is not None:
+            args["desc"] = description
 
         # response contains "revtrnId" on success
-        return await self._make_request("reverseNonAirlineAccrual", args)
+        try:
+            return await self._make_request("reverseNonAirlineAccrual", args)
+        finally:
+            self._invalidate_reads(card_number)
 
     async def non_airline_accrual(
             self,
@@ -314,6 +674,12 @@ class ComarchSOAPAsyncClient:
         """
         if value <= 0:
             raise ValueError("Expected positive value")
+        if isinstance(benefit_codes, str):
+            benefit_codes = benefit_codes or None
+        elif benefit_codes is not None:
+            benefit_codes = ",".join(benefit_codes) or None
+
+        trn_dt = partner_transaction_datetime
         args = {
             "trnType": transaction_type,
             "cardNo": card_number,
@@ -323,24 +689,27 @@ class ComarchSOAPAsyncClient:
             "lastName": last_name.upper(),
 
             "partnerCode": partner_code,
-            "prtTrnDate": partner_transaction_datetime.strftime("%Y%m%d"),
-            "prtTrnTime": partner_transaction_datetime.strftime("%H%M"),
+            "prtTrnDate": f"{trn_dt.year:04d}{trn_dt.month:02d}{trn_dt.day:02d}",
+            "prtTrnTime": f"{trn_dt.hour:02d}{trn_dt.minute:02d}",
 
             "prtTrnId": partner_transaction_id,
         }
-        optionals = {
-            "trnCode": transaction_code,
-            "prtTrnTimeZone": None,  # FIXME: tz name from partner_transaction_datetime if exists?
-            "locCode": location_code,
-            "revenue": None,  # FIXME
-            "desc": description,
-            "benCodes": ",".join([benefit_codes] if isinstance(benefit_codes, str) else benefit_codes or []) or None,
-            "product": None,  # FIXME
-            "dynAttr": None,  # FIXME
-        }
-        args.update((k, v) for k, v in optionals.items() if v is not None)
+        if transaction_code is not None:
+            args["trnCode"] = transaction_code
+        # FIXME: prtTrnTimeZone - tz name from partner_transaction_datetime if exists?
+        if location_code is not None:
+            args["locCode"] = location_code
+        # FIXME: revenue
+        if description is not None:
+            args["desc"] = description
+        if benefit_codes is not None:
+            args["benCodes"] = benefit_codes
+        # FIXME: product, dynAttr
 
-        return await self._make_request("nonAirlineAccrual", args)
+        try:
+            return await self._make_request("nonAirlineAccrual", args)
+        finally:
+            self._invalidate_reads(card_number)
 
     async def enroll(self, customer: Customer, is_complete: bool = False, password: Optional[str] = None) -> dict:
         """
@@ -357,4 +726,8 @@ class ComarchSOAPAsyncClient:
             incompleteData="N" if is_complete else "Y")
         if password:
             args["password"] = password
-        return await self._make_request("enroll", args)
+        try:
+            return await self._make_request("enroll", args)
+        finally:
+            if customer.card_number:
+                self._invalidate_reads(customer.card_number)
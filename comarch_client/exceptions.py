@@ -6,7 +6,17 @@ class BaseError(Exception):
     http_code = None
     error_code = None
     message = None
-    internal_message = None
+
+    def __init_subclass__(cls, **kwargs):
+        """Concrete errors (defining any of message, error_code, http_code) must define all of them"""
+        super().__init_subclass__(**kwargs)
+        if any(attr in cls.__dict__ for attr in ("message", "error_code", "http_code")):
+            if not cls.message:
+                raise TypeError(f"{cls.__name__}: message not implemented!")
+            if not cls.error_code:
+                raise TypeError(f"{cls.__name__}: error code not implemented!")
+            if not cls.http_code:
+                raise TypeError(f"{cls.__name__}: http code not implemented!")
 
     def __init__(self, message=None, error_code=None, http_code=None, internal_message=None):
         """
@@ -15,14 +25,13 @@ class BaseError(Exception):
         :param http_code:
         :param internal_message:
         """
-        self.message = message or self.message
-        self.error_code = error_code or self.error_code
-        self.http_code = http_code or self.http_code
-        self.internal_message = internal_message or self.internal_message
-
-        assert self.message, "Message not implemented!"
-        assert self.error_code, "Error code not implemented!"
-        assert self.http_code, "Http code not implemented!"
+        if message is not None:
+            self.message = message
+        if error_code is not None:
+            self.error_code = error_code
+        if http_code is not None:
+            self.http_code = http_code
+        self.internal_message = internal_message
 
         super(BaseError, self).__init__(message)
 
@@ -2,6 +2,21 @@ from dataclasses import dataclass
 from typing import Optional
 
 
+# (comarch field, attribute) pairs
+_FIELDS = (
+    ("defaultAddress", "default_address"),
+    ("addressType", "address_type"),
+    ("addressLine1", "address_line_1"),
+    ("addressLine2", "address_line_2"),
+    ("addressLine3", "address_line_3"),
+    ("country", "country"),
+    ("state", "state"),
+    ("city", "city"),
+    ("zipCode", "zip_code"),
+    ("email", "email"),
+)
+
+
 @dataclass
 class Address:
     """Customer's address"""
@@ -38,15 +53,4 @@ class Address:
     state: Optional[str] = None
 
     def to_comarch(self) -> dict:
-        return dict(
-            defaultAddress=self.default_address,
-            addressType=self.address_type,
-            addressLine1=self.address_line_1,
-            addressLine2=self.address_line_2,
-            addressLine3=self.address_line_3,
-            country=self.country,
-            state=self.state,
-            city=self.city,
-            zipCode=self.zip_code,
-            email=self.email
-        )
+        return {key: getattr(self, attr) for key, attr in _FIELDS}
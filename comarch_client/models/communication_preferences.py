@@ -1,6 +1,15 @@
 from dataclasses import dataclass
 
 
+# (comarch field, attribute) pairs
+_FIELDS = (
+    ("preferredLanguage", "language"),
+    ("statementPreference", "statement"),
+    ("commPermissionCc", "permission_call_center"),
+    ("commPermissionEmail", "permission_email"),
+)
+
+
 @dataclass
 class CommunicationPreferences:
     """Customer communication preferences."""
@@ -21,9 +30,4 @@ class CommunicationPreferences:
     permission_email: bool
 
     def to_comarch(self) -> dict:
-        return dict(
-            preferredLanguage=self.language,
-            statementPreference=self.statement,
-            commPermissionCc=self.permission_call_center,
-            commPermissionEmail=self.permission_email
-        )
+        return {key: getattr(self, attr) for key, attr in _FIELDS}
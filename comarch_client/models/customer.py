@@ -5,6 +5,14 @@ from typing import Optional, List
 from comarch_client.models import ExtendedAttribute, CommunicationPreferences, Address, PhoneData
 
 
+# (comarch field, attribute) pairs omitted when empty
+_OPTIONAL_FIELDS = (
+    ("title", "title"),
+    ("gender", "gender"),
+    ("cardNumber", "card_number"),
+)
+
+
 @dataclass
 class Customer:
     """Customer model
@@ -35,16 +43,14 @@ class Customer:
             login=self.login,
             firstName=self.first_name,
             lastName=self.last_name,
-            dateOfBirth=self.birthdate.strftime("%d%m%Y"),
+            dateOfBirth=f"{self.birthdate.day:02d}{self.birthdate.month:02d}{self.birthdate.year:04d}",
             phones=[item.to_comarch() for item in self.phones],
             address=[item.to_comarch() for item in self.addresses],
             commPrefs=self.communication_preferences.to_comarch(),
             extAttributes=[item.to_comarch() for item in self.extended_attributes],
         )
-        optionals = {
-            "title": self.title,
-            "gender": self.gender,
-            "cardNumber": self.card_number,
-        }
-        result.update({k: v for k, v in optionals.items() if v})
+        for key, attr in _OPTIONAL_FIELDS:
+            value = getattr(self, attr)
+            if value:
+                result[key] = value
         return result
@@ -12,4 +12,4 @@ class ExtendedAttribute:
     value: Optional[str] = None
 
     def to_comarch(self) -> dict:
-        return dict(code=self.code, value=self.value,)
+        return {"code": self.code, "value": self.value}
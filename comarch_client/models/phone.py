@@ -2,6 +2,16 @@ from dataclasses import dataclass
 from typing import Optional
 
 
+# (comarch field, attribute) pairs
+_FIELDS = (
+    ("phoneNumber", "phone_number"),
+    ("phoneType", "phone_type"),
+    ("altPhoneNumber", "alt_phone_number"),
+    ("altPhoneType", "alt_phone_type"),
+    ("fax", "fax"),
+)
+
+
 @dataclass
 class PhoneData:
     """ Customer phone object """
@@ -13,11 +23,9 @@ class PhoneData:
     fax: Optional[str] = None
 
     def to_comarch(self) -> dict:
-        res = dict(
-            phoneNumber=self.phone_number,
-            phoneType=self.phone_type,
-            altPhoneNumber=self.alt_phone_number,
-            altPhoneType=self.alt_phone_type,
-            fax=self.fax,
-        )
-        return {k: v for k, v in res.items() if v is not None}
+        result = {}
+        for key, attr in _FIELDS:
+            value = getattr(self, attr)
+            if value is not None:
+                result[key] = value
+        return result